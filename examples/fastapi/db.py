@@ -0,0 +1,125 @@
+"""
+데이터베이스 연결 설정
+
+AsyncEngine(커넥션 풀)과 세션 팩토리를 생성하고,
+FastAPI lifespan으로 애플리케이션 수명과 함께 관리합니다.
+"""
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+
+DATABASE_URL = os.environ.get(
+    "DATABASE_URL",
+    "postgresql+asyncpg://localhost:5432/app"
+)
+
+
+def 엔진_생성(
+    url: str = DATABASE_URL,
+    풀_크기: int = 20,
+    최대_초과: int = 10,
+    구문_캐시_크기: int = 2048
+) -> AsyncEngine:
+    """커넥션 풀 설정을 명시한 AsyncEngine을 생성합니다.
+    
+    기본값(pool_size=5, max_overflow=10)은 동시 요청이 조금만 늘어도
+    풀 대기가 발생하므로 서비스 규모에 맞게 지정합니다.
+    
+    Args:
+        url: 데이터베이스 URL
+        풀_크기: 유지할 연결 수
+            권장: (DB 서버 코어 수 × 2 + 디스크 수) ÷ 워커 수
+        최대_초과: 풀_크기를 넘어 임시로 만들 수 있는 연결 수
+        구문_캐시_크기: 연결당 prepared statement 캐시 크기 (asyncpg)
+            같은 쿼리를 다시 prepare하지 않고 bind/execute만 보냅니다.
+    
+    Returns:
+        AsyncEngine: 비동기 엔진
+    
+    Note:
+        (풀_크기 + 최대_초과) × 워커(프로세스) 수가
+        DB의 max_connections를 넘지 않도록 설정하세요.
+    """
+    engine_url = make_url(url)
+    connect_args = {}
+    
+    if engine_url.get_driver_name() == "asyncpg":
+        # asyncpg 자체 캐시 + SQLAlchemy 어댑터의 prepared statement 캐시
+        connect_args["statement_cache_size"] = 구문_캐시_크기
+        if "prepared_statement_cache_size" not in engine_url.query:
+            engine_url = engine_url.update_query_dict(
+                {"prepared_statement_cache_size": str(구문_캐시_크기)}
+            )
+    
+    return create_async_engine(
+        engine_url,
+        connect_args=connect_args,
+        pool_size=풀_크기,
+        max_overflow=최대_초과,
+        pool_pre_ping=True,  # 끊어진 연결을 사용 전에 감지
+        pool_recycle=1800,  # DB/프록시 idle timeout 전에 연결 교체 (초)
+        pool_timeout=30,  # 풀 고갈 시 무한 대기 대신 예외 (초)
+    )
+
+
+def 세션_팩토리_생성(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """세션 팩토리를 생성합니다.
+    
+    Args:
+        engine: 비동기 엔진
+    
+    Returns:
+        async_sessionmaker[AsyncSession]: 세션 팩토리
+    
+    Note:
+        expire_on_commit=True(기본값)이면 커밋 후 속성에 접근할 때마다
+        SELECT가 다시 발생합니다. 비동기에서는 이 지연 로딩이 오류가 되므로
+        반드시 False로 설정합니다.
+    """
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """엔진을 시작 시 생성하고 종료 시 풀의 연결을 정리합니다.
+    
+    Example:
+        >>> app = FastAPI(lifespan=lifespan)
+    """
+    engine = 엔진_생성()
+    app.state.engine = engine
+    app.state.session_factory = 세션_팩토리_생성(engine)
+    
+    try:
+        yield
+    finally:
+        await engine.dispose()
+
+
+async def 세션_주입(request: Request) -> AsyncIterator[AsyncSession]:
+    """요청 단위 트랜잭션 세션을 제공합니다 (FastAPI 의존성).
+    
+    요청이 정상 종료되면 커밋, 예외가 발생하면 롤백합니다.
+    
+    Example:
+        >>> @router.post("/users")
+        ... async def create_user(
+        ...     dto: UserCreateDTO,
+        ...     session: AsyncSession = Depends(세션_주입)
+        ... ):
+        ...     service = UserService(UserRepository(session))
+        ...     return await service.사용자_생성(dto)
+    """
+    async with request.app.state.session_factory() as session:
+        async with session.begin():
+            yield session
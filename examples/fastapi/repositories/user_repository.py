@@ -3,15 +3,217 @@
 
 데이터 접근 로직만 담당하며, 비즈니스 로직은 포함하지 않습니다.
 """
-from typing import Generic, TypeVar
-from sqlalchemy import select, func, and_
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Generic, TypeVar, cast
+from sqlalchemy import (
+    CursorResult, Row, Select, select, insert, update, delete, func, inspect,
+    tuple_, bindparam, event
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction, load_only, raiseload
 
 from src.domain.user import User
 
 
 T = TypeVar('T')
 
+# 정렬 가능한 필드 → (컬럼, 오름차순 기준, 내림차순 기준)
+# 허용 목록으로 임의 속성 접근을 막고, 정렬 기준은 모듈 로드 시 한 번만 생성
+# (id를 보조 키로 포함하여 같은 값끼리의 순서를 고정)
+_SORT_COLUMNS: dict[str, tuple[Any, tuple[Any, ...], tuple[Any, ...]]] = {
+    필드: (컬럼, (컬럼.asc(), User.id.asc()), (컬럼.desc(), User.id.desc()))
+    for 필드, 컬럼 in {
+        "생성일시": User.생성일시,
+        "이름": User.이름,
+    }.items()
+}
+# id는 유일하므로 보조 키 없이 정렬 (ORDER BY id, id 방지)
+_SORT_COLUMNS["id"] = (User.id, (User.id.asc(),), (User.id.desc(),))
+
+# 허용하는 정렬 방향
+_SORT_DIRECTIONS = ("asc", "desc")
+
+# 목록 조회 시 projection 가능한 필드 (목록 응답에 필요한 컬럼)
+_SELECT_COLUMNS = {
+    "id": User.id,
+    "이름": User.이름,
+    "이메일": User.이메일,
+    "활성화": User.활성화,
+    "생성일시": User.생성일시,
+}
+
+# 목록성 조회의 로딩 옵션: 목록 필드만 로드하고 관계/나머지 컬럼 지연 로딩은 금지
+# (비동기 세션에서 지연 로딩은 암묵적 I/O가 되므로 조용히 실행되는 대신 즉시 예외)
+_LIST_LOAD_OPTIONS = (
+    load_only(*_SELECT_COLUMNS.values(), raiseload=True),
+    raiseload("*"),
+)
+
+
+def _목록_구문(
+    select_fields: tuple[str, ...],
+    활성화_필터: bool,
+    정렬_필드: str = "생성일시",
+    정렬_방향: str = "desc",
+    keyset: bool = False
+) -> Select[Any]:
+    """목록 조회 구문을 생성합니다.
+    
+    활성화/커서/offset/limit은 bindparam으로 남겨 실행 시 값만 바인딩합니다.
+    OFFSET 구문은 윈도우 함수로 전체 개수를 함께 조회하고,
+    Keyset 구문은 개수를 세면 커서 이후 행을 모두 읽어야 하므로 목록만 조회합니다.
+    
+    Args:
+        select_fields: 조회할 필드 (_SELECT_COLUMNS 순서, 빈 튜플이면 User 객체)
+        활성화_필터: 활성화 조건 포함 여부
+        정렬_필드: 정렬 기준 필드 (_SORT_COLUMNS의 키)
+        정렬_방향: 정렬 방향 ("asc" 또는 "desc")
+        keyset: 커서 조건 포함 여부 (False면 OFFSET)
+    """
+    stmt: Select[Any]
+    if select_fields:
+        stmt = select(*(_SELECT_COLUMNS[field] for field in select_fields))
+    else:
+        stmt = select(User).options(*_LIST_LOAD_OPTIONS)
+    
+    if 활성화_필터:
+        stmt = stmt.where(User.활성화 == bindparam("활성화"))
+    
+    order_column, 오름차순, 내림차순 = _SORT_COLUMNS[정렬_필드]
+    내림차순_여부 = 정렬_방향 == "desc"
+    stmt = stmt.order_by(*(내림차순 if 내림차순_여부 else 오름차순))
+    
+    if keyset:
+        # 커서 다음 행부터 인덱스 탐색 (앞 페이지 행을 스캔하지 않음)
+        커서_id = bindparam("커서_id", type_=User.id.type)
+        if order_column is User.id:
+            # id 정렬은 (id, id) 행 비교 대신 id만 비교
+            stmt = stmt.where(User.id < 커서_id if 내림차순_여부 else User.id > 커서_id)
+        else:
+            정렬_키 = tuple_(order_column, User.id)
+            커서_키 = tuple_(bindparam("커서_값", type_=order_column.type), 커서_id)
+            stmt = stmt.where(정렬_키 < 커서_키 if 내림차순_여부 else 정렬_키 > 커서_키)
+    else:
+        stmt = (
+            stmt.add_columns(func.count().over().label("total"))
+            .offset(bindparam("offset"))
+        )
+    
+    return stmt.limit(bindparam("limit"))
+
+
+# 대부분의 목록 요청은 기본 형태(생성일시 최신순, OFFSET)이므로
+# 구문을 모듈 로드 시 미리 만들어 재사용
+# (요청마다 구문 트리를 조립하고 캐시 키를 계산하는 비용 제거)
+# 키: (select_fields 튜플 (빈 튜플이면 User 객체), 활성화 필터 여부)
+_DEFAULT_LIST_STMTS = {
+    (select_fields, 활성화_필터): _목록_구문(select_fields, 활성화_필터)
+    for select_fields in ((), tuple(_SELECT_COLUMNS))
+    for 활성화_필터 in (False, True)
+}
+
+
+class UserNameCache:
+    """이름 → 존재 여부 TTL LRU 캐시
+    
+    중복 검증처럼 같은 이름의 존재 여부를 반복 확인하는 경로의 DB 왕복을 줄입니다.
+    커밋된 결과만 보관하며, 프로세스 내에서만 공유됩니다.
+    
+    Attributes:
+        최대_크기: 최대 보관 항목 수 (초과 시 가장 오래된 항목 제거)
+        TTL: 항목 유효 시간 (초)
+        세대: 무효화될 때마다 증가하는 번호
+            조회 전 세대를 기록해 두고 저장 시 비교하여,
+            조회와 저장 사이에 다른 세션이 커밋한 변경을 덮어쓰지 않습니다.
+    
+    Note:
+        멀티 프로세스 배포에서는 쓰기가 다른 프로세스에 전파되지 않으므로
+        TTL만큼 오래된 결과가 반환될 수 있습니다.
+        최종 중복 방지는 DB의 UNIQUE 제약에 맡기세요.
+    """
+    
+    def __init__(self, 최대_크기: int = 4096, TTL: float = 60.0):
+        """
+        Args:
+            최대_크기: 최대 보관 항목 수
+            TTL: 항목 유효 시간 (초)
+        """
+        self.최대_크기 = 최대_크기
+        self.TTL = TTL
+        self.세대 = 0
+        self._항목: OrderedDict[str, tuple[float, bool]] = OrderedDict()
+    
+    def 조회(self, 이름: str) -> bool | None:
+        """캐시된 존재 여부를 반환합니다 (없거나 만료되면 None)."""
+        항목 = self._항목.get(이름)
+        
+        if 항목 is None:
+            return None
+        
+        만료_시각, 존재 = 항목
+        if 만료_시각 < time.monotonic():
+            del self._항목[이름]
+            return None
+        
+        self._항목.move_to_end(이름)
+        return 존재
+    
+    def 저장(self, 이름: str, 존재: bool, 세대: int) -> None:
+        """세대 이후 무효화가 없었을 때만 이름의 존재 여부를 저장합니다."""
+        if 세대 != self.세대:
+            return
+        
+        self._항목[이름] = (time.monotonic() + self.TTL, 존재)
+        self._항목.move_to_end(이름)
+        
+        if len(self._항목) > self.최대_크기:
+            self._항목.popitem(last=False)
+    
+    def 무효화(self, *이름_목록: str) -> None:
+        """이름의 캐시 항목을 제거합니다."""
+        if not 이름_목록:
+            return
+        
+        self.세대 += 1
+        for 이름 in 이름_목록:
+            self._항목.pop(이름, None)
+    
+    def 비우기(self) -> None:
+        """모든 캐시 항목을 제거합니다 (테스트 격리, DB 초기화 후 등)."""
+        self.세대 += 1
+        self._항목.clear()
+
+
+# Repository 인스턴스는 요청(세션)마다 생성되므로 기본 캐시는 모듈 단위로 공유
+# (테스트에서는 UserRepository(session, 이름_캐시=UserNameCache())로 격리)
+_이름_캐시 = UserNameCache()
+
+# 커밋 전까지 캐시 반영을 미루는 대기열 (session.info에 캐시별로 보관)
+# flush된 변경은 롤백될 수 있으므로 캐시는 커밋이 성공한 뒤에만 갱신
+_캐시_대기_키 = "user_name_cache_pending"
+
+
+def _커밋_후_캐시_반영(session: Session) -> None:
+    """커밋된 조회 결과를 저장하고 변경된 이름을 무효화합니다."""
+    대기_목록 = session.info.pop(_캐시_대기_키, None)
+    if not 대기_목록:
+        return
+    
+    for 캐시, 대기 in 대기_목록.items():
+        for 이름, (존재, 세대) in 대기["조회"].items():
+            if 이름 not in 대기["변경"]:
+                캐시.저장(이름, 존재, 세대)
+        
+        캐시.무효화(*대기["변경"])
+
+
+def _트랜잭션_종료_시_대기_폐기(session: Session, transaction: SessionTransaction) -> None:
+    """롤백/close로 끝난 트랜잭션의 대기열을 버립니다."""
+    if transaction.parent is None:
+        session.info.pop(_캐시_대기_키, None)
+
 
 class UserRepository:
     """사용자 데이터 접근 객체
@@ -21,6 +223,7 @@ class UserRepository:
     
     Attributes:
         session: SQLAlchemy 비동기 세션
+        이름_캐시: 이름 존재 여부 캐시
     
     Example:
         >>> async with AsyncSession(engine) as session:
@@ -28,12 +231,35 @@ class UserRepository:
         ...     user = await repository.생성(User(...))
     """
     
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        이름_캐시: UserNameCache | None = None
+    ):
         """
         Args:
             session: SQLAlchemy 비동기 세션
+            이름_캐시: 이름 존재 여부 캐시 (None이면 프로세스 공유 캐시)
         """
         self.session = session
+        self.이름_캐시 = _이름_캐시 if 이름_캐시 is None else 이름_캐시
+        
+        # 캐시 반영 리스너는 전역 Session 클래스가 아닌 이 세션에만 등록
+        sync_session = session.sync_session
+        if not event.contains(sync_session, "after_commit", _커밋_후_캐시_반영):
+            event.listen(sync_session, "after_commit", _커밋_후_캐시_반영)
+            event.listen(
+                sync_session, "after_transaction_end", _트랜잭션_종료_시_대기_폐기
+            )
+    
+    def _캐시_대기(self) -> dict[str, Any]:
+        """이 세션에서 커밋을 기다리는 캐시 변경을 반환합니다.
+        
+        - 조회: 이름 → (존재 여부, 조회 전 세대)
+        - 변경: 이 트랜잭션에서 생성/수정/삭제한 이름
+        """
+        대기_목록 = self.session.info.setdefault(_캐시_대기_키, {})
+        return 대기_목록.setdefault(self.이름_캐시, {"조회": {}, "변경": set()})
     
     async def 생성(self, user: User) -> User:
         """사용자를 생성합니다.
@@ -49,10 +275,14 @@ class UserRepository:
             >>> created = await repository.생성(user)
             >>> print(created.id)
             1
+        
+        Note:
+            SQLAlchemy 2.0은 flush 시 INSERT ... RETURNING으로 ID와
+            서버 기본값(생성일시 등)을 함께 받아오므로 refresh가 필요 없습니다.
         """
         self.session.add(user)
         await self.session.flush()
-        await self.session.refresh(user)
+        self._캐시_대기()["변경"].add(user.이름)
         return user
     
     async def 조회(self, user_id: int) -> User | None:
@@ -81,6 +311,61 @@ class UserRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def 이름_존재여부(self, 이름: str) -> bool:
+        """이름을 사용하는 사용자가 있는지 확인합니다.
+        
+        중복 검증처럼 존재 여부만 필요한 경우 전체 행 대신
+        id 하나만 조회하여 ORM 객체 생성 비용을 줄입니다.
+        
+        Args:
+            이름: 사용자 이름
+        
+        Returns:
+            bool: 존재하면 True
+        
+        Note:
+            결과는 트랜잭션이 커밋된 뒤에만 캐시에 저장되며,
+            롤백되면 조회/변경 내역 모두 캐시에 반영되지 않습니다.
+        """
+        대기 = self._캐시_대기()
+        
+        # 이 트랜잭션에서 변경한 이름은 캐시(커밋된 상태)와 다를 수 있으므로 DB 확인
+        if 이름 not in 대기["변경"]:
+            cached = self.이름_캐시.조회(이름)
+            if cached is not None:
+                return cached
+        
+        세대 = self.이름_캐시.세대
+        stmt = select(User.id).where(User.이름 == 이름).limit(1)
+        result = await self.session.execute(stmt)
+        존재 = result.scalar_one_or_none() is not None
+        
+        대기["조회"][이름] = (존재, 세대)
+        return 존재
+    
+    async def 존재하는_이름_조회(self, 이름_목록: list[str]) -> set[str]:
+        """이미 사용 중인 이름을 한 번에 조회합니다 (Batch 처리).
+        
+        Args:
+            이름_목록: 확인할 이름 목록
+        
+        Returns:
+            set[str]: 이름_목록 중 이미 존재하는 이름
+        
+        Example:
+            >>> # ❌ Bad: N번 조회
+            >>> 중복 = [이름 for 이름 in 이름_목록 if await repository.이름_존재여부(이름)]
+            
+            >>> # ✅ Good: IN 절로 한 번에 조회
+            >>> 중복 = await repository.존재하는_이름_조회(이름_목록)
+        """
+        if not 이름_목록:
+            return set()
+        
+        stmt = select(User.이름).where(User.이름.in_(이름_목록))
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+    
     async def ID_목록으로_조회(
         self,
         user_ids: list[int],
@@ -92,8 +377,10 @@ class UserRepository:
         
         Args:
             user_ids: 사용자 ID 목록
-            select_fields: 조회할 필드 목록 (None이면 전체)
+            select_fields: 조회할 필드 목록
                 예: ["id", "이름", "이메일"]
+                None이면 User 객체로 반환하되 목록 필드(_SELECT_COLUMNS)만 로드하며,
+                그 외 컬럼이나 관계에 접근하면 지연 로딩 대신 예외가 발생합니다.
         
         Returns:
             list[User]: 조회된 사용자 목록
@@ -107,6 +394,9 @@ class UserRepository:
             
             >>> # ✅ Good: Batch 처리
             >>> users = await repository.ID_목록으로_조회(user_ids)
+        
+        Note:
+            수천 건 이상을 처리하는 배치 작업은 `ID_목록으로_순회`를 사용하세요.
         """
         if not user_ids:
             return []
@@ -116,31 +406,107 @@ class UserRepository:
             fields = [getattr(User, field) for field in select_fields]
             stmt = select(*fields).where(User.id.in_(user_ids))
         else:
-            # 전체 필드 SELECT
-            stmt = select(User).where(User.id.in_(user_ids))
+            # 목록 필드만 로드 (관계 지연 로딩 금지)
+            stmt = (
+                select(User)
+                .where(User.id.in_(user_ids))
+                .options(*_LIST_LOAD_OPTIONS)
+            )
         
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
     
+    async def ID_목록으로_순회(
+        self,
+        user_ids: list[int],
+        묶음_크기: int = 500
+    ) -> AsyncIterator[Sequence[User]]:
+        """여러 사용자를 묶음 단위로 스트리밍 조회합니다.
+        
+        ID_목록으로_조회는 모든 행을 한 번에 객체로 만들고 세션에 쌓아두므로,
+        대량 ID를 처리하는 배치 작업에서는 메모리가 계속 증가합니다.
+        이 메서드는 서버 사이드 커서로 묶음_크기만큼만 가져오고,
+        처리가 끝난 묶음은 세션에서 분리(expunge)합니다.
+        
+        Args:
+            user_ids: 사용자 ID 목록
+            묶음_크기: 한 번에 가져올 행 수
+        
+        Yields:
+            Sequence[User]: 묶음_크기 이하의 사용자 목록
+        
+        Example:
+            >>> from contextlib import aclosing
+            >>> async with aclosing(repository.ID_목록으로_순회(user_ids)) as 묶음들:
+            ...     async for users in 묶음들:
+            ...         await 알림_발송(users)
+        
+        Note:
+            다음 묶음을 요청하면 이전 묶음의 수정 사항을 flush한 뒤
+            객체를 세션에서 분리합니다. 분리된 객체를 이후에 수정해도
+            DB에는 반영되지 않습니다.
+            
+            반드시 contextlib.aclosing으로 감싸서 사용하세요.
+            async for를 break로 빠져나오면 제너레이터는 일시 정지된 채 남고,
+            커서는 나중에 이벤트 루프의 finalizer가 별도 태스크로 닫습니다.
+            그 사이 같은 세션의 다음 쿼리와 커서 정리가 한 연결에서 겹칠 수 있습니다.
+            
+            중간에 빠져나오면 마지막으로 받은 묶음은 flush/expunge되지 않고
+            세션에 남으므로, 수정 사항은 다음 flush나 커밋 때 반영됩니다.
+        """
+        if not user_ids:
+            return
+        
+        stmt = (
+            select(User)
+            .where(User.id.in_(user_ids))
+            .execution_options(yield_per=묶음_크기)
+        )
+        
+        result = await self.session.stream(stmt)
+        try:
+            async for users in result.scalars().partitions():
+                yield users
+                
+                # 묶음에서 수정한 내용을 먼저 반영한 뒤 분리 (변경이 없으면 no-op)
+                await self.session.flush()
+                
+                # 처리된 묶음을 identity map에서 제거하여 메모리 누적 방지
+                for user in users:
+                    self.session.expunge(user)
+        finally:
+            # 제너레이터가 닫힐 때(aclosing 종료, 소진, 예외) 서버 사이드 커서를 닫음
+            await result.close()
+    
     async def 목록_조회(
         self,
         페이지: int,
         페이지_크기: int,
         활성화_여부: bool | None = None,
         정렬_필드: str = "생성일시",
-        정렬_방향: str = "desc"
+        정렬_방향: str = "desc",
+        커서: tuple[Any, int] | None = None
     ) -> tuple[list[User], int]:
         """페이지네이션된 사용자 목록을 조회합니다.
         
         Args:
-            페이지: 페이지 번호 (1부터 시작)
+            페이지: 페이지 번호 (1부터 시작, 커서가 있으면 무시)
             페이지_크기: 한 페이지당 항목 수
             활성화_여부: 활성화 상태 필터 (None이면 전체)
             정렬_필드: 정렬 기준 필드
             정렬_방향: 정렬 방향 ("asc" 또는 "desc")
+            커서: 이전 페이지 마지막 사용자의 (정렬_필드 값, id)
+                지정하면 OFFSET 대신 Keyset 페이지네이션을 사용합니다.
         
         Returns:
             tuple[list[User], int]: (사용자 목록, 전체 개수)
+                목록 필드(_SELECT_COLUMNS)만 로드하며, 그 외 컬럼이나 관계에
+                접근하면 지연 로딩 대신 예외가 발생합니다.
+                커서를 지정하면 개수를 세지 않으므로 전체 개수는 항상 0입니다.
+        
+        Raises:
+            ValueError: 정렬할 수 없는 필드나 방향인 경우
+                (필드 허용: "생성일시", "이름", "id" / 방향 허용: "asc", "desc")
         
         Example:
             >>> users, total = await repository.목록_조회(
@@ -149,39 +515,136 @@ class UserRepository:
             ...     활성화_여부=True
             ... )
             >>> print(f"전체 {total}명 중 {len(users)}명 조회")
+            
+            >>> # 다음 페이지 (깊은 페이지도 인덱스 탐색으로 조회)
+            >>> last = users[-1]
+            >>> users, _ = await repository.목록_조회(
+            ...     페이지=1,
+            ...     페이지_크기=20,
+            ...     커서=(last.생성일시, last.id)
+            ... )
+        
+        Note:
+            Keyset 페이지네이션은 (정렬_필드, id) 복합 인덱스가 필요합니다.
+            예: CREATE INDEX ix_users_생성일시_id ON users (생성일시 DESC, id DESC)
         """
-        # 기본 쿼리
-        query = select(User)
+        rows, total = await self._목록_행_조회(
+            (), 페이지, 페이지_크기, 활성화_여부, 정렬_필드, 정렬_방향, 커서
+        )
+        return [row[0] for row in rows], total
+    
+    async def 목록_필드_조회(
+        self,
+        페이지: int,
+        페이지_크기: int,
+        select_fields: list[str],
+        활성화_여부: bool | None = None,
+        정렬_필드: str = "생성일시",
+        정렬_방향: str = "desc",
+        커서: tuple[Any, int] | None = None
+    ) -> tuple[list[dict[str, Any]], int]:
+        """페이지네이션된 사용자 목록을 필요한 필드만 조회합니다.
         
-        # 필터 적용
-        conditions = []
-        if 활성화_여부 is not None:
-            conditions.append(User.활성화 == 활성화_여부)
+        ORM 객체를 만들지 않고 {필드: 값} dict로 반환하므로
+        내보내기처럼 엔티티가 필요 없는 대량 목록에 사용합니다.
+        
+        Args:
+            페이지: 페이지 번호 (1부터 시작, 커서가 있으면 무시)
+            페이지_크기: 한 페이지당 항목 수
+            select_fields: 조회할 필드 목록
+                예: ["id", "이름", "이메일"]
+            활성화_여부: 활성화 상태 필터 (None이면 전체)
+            정렬_필드: 정렬 기준 필드
+            정렬_방향: 정렬 방향 ("asc" 또는 "desc")
+            커서: 이전 페이지 마지막 행의 (정렬_필드 값, id)
+        
+        Returns:
+            tuple[list[dict[str, Any]], int]: ({필드: 값} 목록, 전체 개수)
+                커서를 지정하면 개수를 세지 않으므로 전체 개수는 항상 0입니다.
+        
+        Raises:
+            ValueError: 정렬 또는 조회할 수 없는 필드이거나 정렬 방향이 잘못된 경우
         
-        if conditions:
-            query = query.where(and_(*conditions))
+        Example:
+            >>> rows, total = await repository.목록_필드_조회(
+            ...     페이지=1,
+            ...     페이지_크기=100,
+            ...     select_fields=["id", "이메일"]
+            ... )
+        
+        Note:
+            커버링 인덱스가 있으면 테이블을 읽지 않고 인덱스만으로 처리합니다.
+            예: CREATE INDEX CONCURRENTLY ix_users_생성일시_covering
+                ON users (생성일시 DESC, id DESC) INCLUDE (이름, 이메일, 활성화)
+        """
+        if not select_fields:
+            raise ValueError("조회할 필드를 지정해야 합니다")
         
-        # 전체 개수 조회 (필터 적용 후)
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar_one()
+        for field in select_fields:
+            if field not in _SELECT_COLUMNS:
+                raise ValueError(f"조회할 수 없는 필드입니다: {field}")
         
-        # 정렬
-        order_column = getattr(User, 정렬_필드)
-        if 정렬_방향 == "desc":
-            query = query.order_by(order_column.desc())
+        # 필드 순서를 _SELECT_COLUMNS 순서로 정규화 (같은 필드 조합은 같은 구문)
+        fields = tuple(field for field in _SELECT_COLUMNS if field in select_fields)
+        
+        rows, total = await self._목록_행_조회(
+            fields, 페이지, 페이지_크기, 활성화_여부, 정렬_필드, 정렬_방향, 커서
+        )
+        return [dict(zip(fields, row)) for row in rows], total
+    
+    async def _목록_행_조회(
+        self,
+        select_fields: tuple[str, ...],
+        페이지: int,
+        페이지_크기: int,
+        활성화_여부: bool | None,
+        정렬_필드: str,
+        정렬_방향: str,
+        커서: tuple[Any, int] | None
+    ) -> tuple[Sequence[Row[Any]], int]:
+        """목록 조회 쿼리를 실행하고 (행 목록, 전체 개수)를 반환합니다.
+        
+        select_fields가 비어 있으면 각 행의 첫 값은 User 객체입니다.
+        """
+        if 정렬_필드 not in _SORT_COLUMNS:
+            raise ValueError(f"정렬할 수 없는 필드입니다: {정렬_필드}")
+        
+        if 정렬_방향 not in _SORT_DIRECTIONS:
+            raise ValueError(f"정렬할 수 없는 방향입니다: {정렬_방향}")
+        
+        활성화_필터 = 활성화_여부 is not None
+        keyset = 커서 is not None
+        
+        # 기본 형태(생성일시 최신순, OFFSET)는 미리 만든 구문을 재사용
+        stmt: Select[Any] | None = None
+        if 정렬_필드 == "생성일시" and 정렬_방향 == "desc" and not keyset:
+            stmt = _DEFAULT_LIST_STMTS.get((select_fields, 활성화_필터))
+        if stmt is None:
+            stmt = _목록_구문(select_fields, 활성화_필터, 정렬_필드, 정렬_방향, keyset)
+        
+        # 구문에는 값이 없으므로 실행 시 바인딩
+        params: dict[str, Any] = {"limit": 페이지_크기}
+        if 활성화_필터:
+            params["활성화"] = 활성화_여부
+        if 커서 is not None:
+            params["커서_값"], params["커서_id"] = 커서
         else:
-            query = query.order_by(order_column.asc())
+            params["offset"] = (페이지 - 1) * 페이지_크기
         
-        # 페이지네이션
-        offset = (페이지 - 1) * 페이지_크기
-        query = query.offset(offset).limit(페이지_크기)
+        result = await self.session.execute(stmt, params)
         
-        # 실행
-        result = await self.session.execute(query)
-        users = list(result.scalars().all())
+        rows = result.all()
+        if 커서 is not None:
+            return rows, 0
+        
+        total = rows[0][-1] if rows else 0
+        
+        # 범위를 벗어난 페이지는 행이 없어 개수를 알 수 없으므로 별도 조회
+        # (서브쿼리로 감싸지 않고 User에 직접 조건을 걸어 인덱스를 활용)
+        if not rows and 페이지 > 1:
+            total = await self.개수_조회(활성화_여부)
         
-        return users, total
+        return rows, total
     
     async def 이름으로_검색(
         self,
@@ -195,15 +658,25 @@ class UserRepository:
             최대_개수: 최대 반환 개수
         
         Returns:
-            list[User]: 검색된 사용자 목록
+            list[User]: 검색된 사용자 목록 (id 순)
         
         Example:
             >>> users = await repository.이름으로_검색("홍")
             >>> # "홍길동", "홍길순" 등 검색
+        
+        Note:
+            '%x%' 패턴은 B-tree 인덱스를 사용할 수 없어 전체 테이블을 스캔합니다.
+            PostgreSQL이라면 (선택 사항) pg_trgm GIN 인덱스로 부분 일치도
+            인덱스로 처리할 수 있으며, 쿼리는 확장 없이도 동작합니다.
+                CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                CREATE INDEX CONCURRENTLY ix_users_이름_trgm
+                    ON users USING GIN (이름 gin_trgm_ops);
+            검색어의 %, _ 는 와일드카드가 아닌 문자 그대로 검색합니다.
         """
         stmt = (
             select(User)
-            .where(User.이름.like(f"%{검색어}%"))
+            .where(User.이름.contains(검색어, autoescape=True))
+            .order_by(User.id)
             .limit(최대_개수)
         )
         
@@ -222,9 +695,14 @@ class UserRepository:
         Note:
             세션에 이미 추가된 엔티티를 수정하는 경우,
             명시적으로 merge를 호출하지 않아도 자동으로 추적됩니다.
+            변경된 값은 세션이 이미 알고 있으므로 refresh로 다시 조회하지 않습니다.
+            (세션 팩토리는 expire_on_commit=False로 설정합니다. db.py 참고)
         """
+        # 이름이 변경된 경우 이전/새 이름 모두 캐시에서 제거
+        이름_이력 = inspect(user).attrs.이름.history
+        
         await self.session.flush()
-        await self.session.refresh(user)
+        self._캐시_대기()["변경"].update(이름_이력.added, 이름_이력.deleted)
         return user
     
     async def 삭제(self, user_id: int) -> bool:
@@ -239,14 +717,16 @@ class UserRepository:
         Note:
             Soft delete가 아닌 Hard delete입니다.
             Soft delete가 필요하면 활성화 필드를 False로 변경하세요.
+            조회 없이 DELETE 한 번으로 처리하며, 삭제된 행이 없으면 False입니다.
         """
-        user = await self.조회(user_id)
+        stmt = delete(User).where(User.id == user_id).returning(User.이름)
+        result = await self.session.execute(stmt)
+        이름 = result.scalar_one_or_none()
         
-        if not user:
+        if 이름 is None:
             return False
         
-        await self.session.delete(user)
-        await self.session.flush()
+        self._캐시_대기()["변경"].add(이름)
         return True
     
     async def 소프트_삭제(self, user_id: int) -> bool:
@@ -257,15 +737,14 @@ class UserRepository:
         
         Returns:
             bool: 삭제 성공 여부
-        """
-        user = await self.조회(user_id)
-        
-        if not user:
-            return False
         
-        user.활성화 = False
-        await self.session.flush()
-        return True
+        Note:
+            행은 남아 이름도 계속 사용 중이므로 이름 캐시는 유지합니다.
+        """
+        stmt = update(User).where(User.id == user_id).values(활성화=False)
+        # DML 실행 결과는 CursorResult (rowcount 제공)
+        result = cast(CursorResult[Any], await self.session.execute(stmt))
+        return result.rowcount > 0
     
     async def 개수_조회(
         self,
@@ -296,7 +775,7 @@ class UserRepository:
             users: 생성할 사용자 목록
         
         Returns:
-            list[User]: 생성된 사용자 목록
+            list[User]: 생성된 사용자 목록 (입력 순서, 세션에 연결된 객체)
         
         Example:
             >>> users = [
@@ -304,14 +783,82 @@ class UserRepository:
             ...     User(이름="김철수", 이메일="kim@test.com"),
             ... ]
             >>> created = await repository.일괄_생성(users)
+        
+        Note:
+            add_all 후 사용자마다 refresh를 호출하면 N번의 SELECT가 추가됩니다.
+            INSERT ... RETURNING으로 DB가 생성한 행을 한 번에 받아옵니다.
+            인자로 넘긴 객체에도 id/활성화/생성일시를 채우지만 세션에는
+            추가되지 않으므로, 이후 수정하려면 반환값을 사용하세요.
+            파라미터 목록을 넘기면 ORM unit-of-work를 거치지 않고
+            다중 VALUES 배치로 실행됩니다.
+            ID가 필요 없는 수천 건 이상의 적재는 `대량_적재`를 사용하세요.
         """
-        self.session.add_all(users)
-        await self.session.flush()
+        if not users:
+            return []
         
-        for user in users:
-            await self.session.refresh(user)
+        # 값이 없는 컬럼은 키를 빼서 컬럼 기본값(활성화 등)이 적용되도록 함
+        payload = [
+            {
+                컬럼: 값
+                for 컬럼, 값 in (
+                    ("이름", user.이름),
+                    ("이메일", user.이메일),
+                    ("활성화", user.활성화),
+                )
+                if 값 is not None
+            }
+            for user in users
+        ]
+        stmt = insert(User).returning(User, sort_by_parameter_order=True)
+        created = list(await self.session.scalars(stmt, payload))
+        
+        # RETURNING 결과(입력 순서)의 DB 생성 값을 인자 객체에도 반영
+        for user, 생성된_user in zip(users, created):
+            user.id = 생성된_user.id
+            user.활성화 = 생성된_user.활성화
+            user.생성일시 = 생성된_user.생성일시
+        
+        self._캐시_대기()["변경"].update(user.이름 for user in created)
+        return created
+    
+    async def 대량_적재(self, users: list[User]) -> int:
+        """PostgreSQL COPY 프로토콜로 사용자를 대량 적재합니다.
+        
+        INSERT보다 훨씬 빠르지만 생성된 ID를 돌려받을 수 없으므로
+        마이그레이션, 초기 데이터 적재처럼 결과가 필요 없는 경우에 사용합니다.
+        
+        Args:
+            users: 적재할 사용자 목록
+        
+        Returns:
+            int: 적재된 행 수
+        
+        Note:
+            asyncpg 드라이버 전용입니다.
+        """
+        if not users:
+            return 0
+        
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        assert driver_connection is not None, "DBAPI 연결이 이미 해제되었습니다"
+        
+        # COPY는 컬럼 기본값을 적용하지 않고 None을 NULL로 적재하므로
+        # 값이 없는 활성화는 모델 기본값(True)으로 채움
+        records = [
+            (user.이름, user.이메일, True if user.활성화 is None else user.활성화)
+            for user in users
+        ]
+        
+        await driver_connection.copy_records_to_table(
+            User.__tablename__,
+            records=records,
+            columns=["이름", "이메일", "활성화"]
+        )
         
-        return users
+        self._캐시_대기()["변경"].update(user.이름 for user in users)
+        return len(users)
 
 
 # 추상 Repository 패턴 (선택적)
@@ -339,7 +886,6 @@ class BaseRepository(Generic[T]):
         """엔티티를 생성합니다."""
         self.session.add(entity)
         await self.session.flush()
-        await self.session.refresh(entity)
         return entity
     
     async def find_by_id(self, id: int) -> T | None:
@@ -357,7 +903,6 @@ class BaseRepository(Generic[T]):
     async def update(self, entity: T) -> T:
         """엔티티를 수정합니다."""
         await self.session.flush()
-        await self.session.refresh(entity)
         return entity
     
     async def delete(self, id: int) -> bool:
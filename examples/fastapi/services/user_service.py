@@ -3,13 +3,70 @@
 
 비즈니스 로직을 캡슐화하고 Repository를 통해 데이터에 접근합니다.
 """
-from typing import Protocol
+import base64
+import binascii
+import json
+from collections import Counter
+from datetime import datetime
+from string import ascii_letters, digits
+from typing import Any, Protocol
 
 from src.domain.user import User
 from src.dto.request.user import UserCreateDTO, UserUpdateDTO
 from src.dto.response.user import UserResponse, PaginatedResponse
 
 
+# 이메일 허용 문자 (bytes.translate로 삭제 후 남는 바이트가 있으면 형식 오류)
+_LOCAL_ALLOWED = (ascii_letters + digits + "._%+-").encode()
+_DOMAIN_ALLOWED = (ascii_letters + digits + ".-").encode()
+_TLD_ALLOWED = ascii_letters.encode()
+
+
+def _이메일_형식_일치(이메일: str) -> bool:
+    """이메일이 `로컬@도메인.TLD` 형식인지 확인합니다.
+    
+    정규식 대신 ASCII 바이트에 translate를 적용하여
+    문자 집합 검사를 한 번의 C 루프로 처리합니다 (백트래킹 없음).
+    """
+    # 비 ASCII는 즉시 거부 (isascii는 문자열 길이와 무관하게 O(1))
+    if not 이메일.isascii():
+        return False
+    
+    data = 이메일.encode("ascii")
+    at = data.rfind(b"@")
+    local, domain = data[:at], data[at + 1:]
+    dot = domain.rfind(b".")
+    host, tld = domain[:dot], domain[dot + 1:]
+    
+    return not (
+        at < 1
+        or dot < 1
+        or len(tld) < 2
+        or local.translate(None, _LOCAL_ALLOWED)
+        or host.translate(None, _DOMAIN_ALLOWED)
+        or tld.translate(None, _TLD_ALLOWED)
+    )
+
+
+def _커서_인코딩(user: User) -> str:
+    """사용자의 (생성일시, id)를 페이지네이션 커서 문자열로 변환합니다."""
+    payload = json.dumps([user.생성일시.isoformat(), user.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _커서_디코딩(커서: str) -> tuple[datetime, int]:
+    """커서 문자열을 (생성일시, id)로 변환합니다.
+    
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        생성일시, user_id = json.loads(base64.urlsafe_b64decode(커서))
+        return datetime.fromisoformat(생성일시), int(user_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError(f"올바른 커서 형식이 아닙니다: {커서}") from e
+
+
 class IUserRepository(Protocol):
     """UserRepository 인터페이스
     
@@ -28,10 +85,22 @@ class IUserRepository(Protocol):
         """이름으로 사용자를 조회합니다."""
         ...
     
+    async def 이름_존재여부(self, 이름: str) -> bool:
+        """이름을 사용하는 사용자가 있는지 확인합니다."""
+        ...
+    
+    async def 존재하는_이름_조회(self, 이름_목록: list[str]) -> set[str]:
+        """이미 사용 중인 이름을 한 번에 조회합니다."""
+        ...
+    
     async def 목록_조회(
         self,
         페이지: int,
-        페이지_크기: int
+        페이지_크기: int,
+        활성화_여부: bool | None = None,
+        정렬_필드: str = "생성일시",
+        정렬_방향: str = "desc",
+        커서: tuple[Any, int] | None = None
     ) -> tuple[list[User], int]:
         """페이지네이션된 사용자 목록을 조회합니다."""
         ...
@@ -43,6 +112,10 @@ class IUserRepository(Protocol):
     async def 삭제(self, user_id: int) -> bool:
         """사용자를 삭제합니다."""
         ...
+    
+    async def 일괄_생성(self, users: list[User]) -> list[User]:
+        """여러 사용자를 한 번에 생성합니다."""
+        ...
 
 
 class UserService:
@@ -95,15 +168,15 @@ class UserService:
             '홍길동'
         """
         # 1. 입력 검증
-        self._이름_길이_검증(dto.이름)
+        이름 = self._이름_길이_검증(dto.이름)
         self._이메일_형식_검증(dto.이메일)
         
         # 2. 비즈니스 규칙 검증
-        await self._이름_중복_검증(dto.이름)
+        await self._이름_중복_검증(이름)
         
         # 3. 엔티티 생성
         user = User(
-            이름=dto.이름.strip(),
+            이름=이름,
             이메일=dto.이메일.lower(),
             활성화=True
         )
@@ -111,6 +184,62 @@ class UserService:
         # 4. 저장
         return await self.repository.생성(user)
     
+    async def 사용자_일괄_생성(self, dtos: list[UserCreateDTO]) -> list[User]:
+        """여러 사용자를 한 번에 생성합니다.
+        
+        이름 중복은 사용자마다 조회하지 않고 한 번의 쿼리로 검증합니다.
+        
+        Args:
+            dtos: 사용자 생성 요청 DTO 목록
+        
+        Returns:
+            list[User]: 생성된 사용자 엔티티 목록
+        
+        Raises:
+            ValueError: 검증 실패 시
+                - 이름 길이 또는 이메일 형식 오류
+                - 요청 내 이름 중복
+                - 이미 존재하는 이름 (중복된 이름 전체를 메시지에 포함)
+        
+        Example:
+            >>> dtos = [
+            ...     UserCreateDTO(이름="홍길동", 이메일="hong@test.com"),
+            ...     UserCreateDTO(이름="김철수", 이메일="kim@test.com"),
+            ... ]
+            >>> users = await service.사용자_일괄_생성(dtos)
+        """
+        if not dtos:
+            return []
+        
+        # 1. 입력 검증
+        이름_목록 = []
+        for dto in dtos:
+            이름_목록.append(self._이름_길이_검증(dto.이름))
+            self._이메일_형식_검증(dto.이메일)
+        
+        # 2. 요청 내 중복 검증
+        요청_내_중복 = sorted(
+            이름 for 이름, 개수 in Counter(이름_목록).items() if 개수 > 1
+        )
+        if 요청_내_중복:
+            raise ValueError(
+                f"요청에 중복된 이름이 있습니다: {', '.join(요청_내_중복)}"
+            )
+        
+        # 3. 기존 사용자와의 중복 검증 (한 번의 쿼리)
+        존재하는_이름 = await self.repository.존재하는_이름_조회(이름_목록)
+        if 존재하는_이름:
+            raise ValueError(
+                f"이미 존재하는 이름입니다: {', '.join(sorted(존재하는_이름))}"
+            )
+        
+        # 4. 엔티티 생성 및 저장
+        users = [
+            User(이름=이름, 이메일=dto.이메일.lower(), 활성화=True)
+            for 이름, dto in zip(이름_목록, dtos)
+        ]
+        return await self.repository.일괄_생성(users)
+    
     async def 사용자_조회(self, user_id: int) -> User:
         """사용자를 조회합니다.
         
@@ -159,7 +288,7 @@ class UserService:
         if not (1 <= 페이지_크기 <= 100):
             raise ValueError("페이지 크기는 1-100 사이여야 합니다")
         
-        # 조회
+        # 조회 (Repository가 목록 필드만 로드)
         users, total = await self.repository.목록_조회(페이지, 페이지_크기)
         
         # DTO 변환
@@ -174,6 +303,45 @@ class UserService:
             pages=(total + 페이지_크기 - 1) // 페이지_크기
         )
     
+    async def 사용자_커서_목록_조회(
+        self,
+        커서: str | None = None,
+        페이지_크기: int = 20
+    ) -> tuple[list[UserResponse], str | None]:
+        """커서 기반으로 사용자 목록을 조회합니다 (최신순).
+        
+        OFFSET 방식과 달리 깊은 페이지에서도 조회 비용이 일정합니다.
+        무한 스크롤처럼 "다음 페이지"만 필요한 화면에 사용합니다.
+        
+        Args:
+            커서: 이전 응답의 다음 커서 (None이면 첫 페이지)
+            페이지_크기: 한 페이지당 항목 수 (기본: 20, 최대: 100)
+        
+        Returns:
+            tuple[list[UserResponse], str | None]: (사용자 목록, 다음 커서)
+                마지막 페이지이면 다음 커서는 None입니다.
+        
+        Raises:
+            ValueError: 커서 형식이 올바르지 않거나 페이지 크기가 범위를 벗어난 경우
+        
+        Example:
+            >>> items, 다음_커서 = await service.사용자_커서_목록_조회()
+            >>> items, 다음_커서 = await service.사용자_커서_목록_조회(다음_커서)
+        """
+        # 입력 검증
+        if not (1 <= 페이지_크기 <= 100):
+            raise ValueError("페이지 크기는 1-100 사이여야 합니다")
+        
+        이전_키 = _커서_디코딩(커서) if 커서 else None
+        
+        # 조회
+        users, _ = await self.repository.목록_조회(1, 페이지_크기, 커서=이전_키)
+        
+        # 페이지가 가득 찼을 때만 다음 커서 발급
+        다음_커서 = _커서_인코딩(users[-1]) if len(users) == 페이지_크기 else None
+        
+        return [UserResponse.from_entity(user) for user in users], 다음_커서
+    
     async def 사용자_수정(
         self,
         user_id: int,
@@ -196,13 +364,13 @@ class UserService:
         
         # 수정할 필드 검증 및 업데이트
         if dto.이름:
-            self._이름_길이_검증(dto.이름)
+            이름 = self._이름_길이_검증(dto.이름)
             
             # 다른 사용자가 사용 중인지 확인
-            if dto.이름 != user.이름:
-                await self._이름_중복_검증(dto.이름)
+            if 이름 != user.이름:
+                await self._이름_중복_검증(이름)
             
-            user.이름 = dto.이름.strip()
+            user.이름 = 이름
         
         if dto.이메일:
             self._이메일_형식_검증(dto.이메일)
@@ -223,24 +391,28 @@ class UserService:
         Raises:
             ValueError: 사용자가 존재하지 않는 경우
         """
-        # 존재 여부 확인
-        await self.사용자_조회(user_id)
+        # 별도 조회 없이 삭제 결과로 존재 여부 판단
+        if not await self.repository.삭제(user_id):
+            raise ValueError(f"사용자를 찾을 수 없습니다: {user_id}")
         
-        # 삭제
-        return await self.repository.삭제(user_id)
+        return True
     
     # Private 검증 메서드들
     
-    def _이름_길이_검증(self, 이름: str) -> None:
+    def _이름_길이_검증(self, 이름: str) -> str:
         """이름 길이를 검증합니다.
         
         Args:
             이름: 검증할 이름
         
+        Returns:
+            str: 앞뒤 공백을 제거한 이름 (중복 검증과 저장에 그대로 사용)
+        
         Raises:
             ValueError: 이름 길이가 범위를 벗어난 경우
         """
-        이름_길이 = len(이름.strip())
+        이름 = 이름.strip()
+        이름_길이 = len(이름)
         
         if 이름_길이 < self.최소_이름_길이:
             raise ValueError(
@@ -251,6 +423,8 @@ class UserService:
             raise ValueError(
                 f"이름은 {self.최대_이름_길이}자 이하여야 합니다"
             )
+        
+        return 이름
     
     def _이메일_형식_검증(self, 이메일: str) -> None:
         """이메일 형식을 검증합니다.
@@ -261,11 +435,7 @@ class UserService:
         Raises:
             ValueError: 이메일 형식이 올바르지 않은 경우
         """
-        import re
-        
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        if not re.match(pattern, 이메일):
+        if not _이메일_형식_일치(이메일):
             raise ValueError(f"올바른 이메일 형식이 아닙니다: {이메일}")
     
     async def _이름_중복_검증(self, 이름: str) -> None:
@@ -277,7 +447,5 @@ class UserService:
         Raises:
             ValueError: 이름이 이미 존재하는 경우
         """
-        existing = await self.repository.이름으로_조회(이름)
-        
-        if existing:
+        if await self.repository.이름_존재여부(이름):
             raise ValueError(f"이미 존재하는 이름입니다: {이름}")
@@ -0,0 +1,154 @@
+"""
+테스트용 Fake Repository
+
+AsyncMock 대신 dict로 IUserRepository를 구현합니다.
+호출 기록/속성 탐색 비용이 없어 빠르고, 상태를 직접 검사할 수 있습니다.
+"""
+from datetime import datetime
+from typing import Any
+
+from src.domain.user import User
+from src.service.user_service import IUserRepository
+
+
+class InMemoryUserRepository(IUserRepository):
+    """dict 기반 UserRepository Fake
+    
+    실제 DB 대신 메모리에 사용자를 저장합니다.
+    메서드 호출 횟수는 `<메서드명>_calls` 속성으로 확인합니다.
+    IUserRepository를 명시적으로 상속하므로 시그니처가 어긋나면
+    타입 체커(mypy)가 정의 시점에 오류를 보고합니다.
+    
+    Example:
+        >>> repository = InMemoryUserRepository()
+        >>> repository.추가(User(id=1, 이름="홍길동", 이메일="hong@test.com"))
+        >>> service = UserService(repository)
+        >>> await service.사용자_조회(1)
+        >>> assert repository.조회_calls == 1
+    """
+    
+    def __init__(self) -> None:
+        self._store: dict[int, User] = {}
+        self._by_name: dict[str, User] = {}
+        self._next_id = 1
+        
+        # 호출 횟수 (spy)
+        self.생성_calls = 0
+        self.조회_calls = 0
+        self.이름으로_조회_calls = 0
+        self.이름_존재여부_calls = 0
+        self.존재하는_이름_조회_calls = 0
+        self.목록_조회_calls = 0
+        self.수정_calls = 0
+        self.삭제_calls = 0
+        self.일괄_생성_calls = 0
+    
+    def 추가(self, *users: User) -> None:
+        """테스트 데이터를 저장합니다 (호출 횟수에 포함되지 않음)."""
+        for user in users:
+            self._저장(user)
+    
+    def _저장(self, user: User) -> User:
+        """ID/기본값을 채우고 인덱스를 갱신합니다."""
+        if user.id is None:
+            user.id = self._next_id
+        if user.활성화 is None:
+            user.활성화 = True
+        if user.생성일시 is None:
+            user.생성일시 = datetime.now()
+        
+        self._next_id = max(self._next_id, user.id + 1)
+        
+        # 이름이 바뀐 경우 이전 이름 인덱스 제거
+        for 이름, stored in list(self._by_name.items()):
+            if stored.id == user.id:
+                del self._by_name[이름]
+        
+        self._store[user.id] = user
+        self._by_name[user.이름] = user
+        return user
+    
+    async def 생성(self, user: User) -> User:
+        self.생성_calls += 1
+        return self._저장(user)
+    
+    async def 조회(self, user_id: int) -> User | None:
+        self.조회_calls += 1
+        return self._store.get(user_id)
+    
+    async def 이름으로_조회(self, 이름: str) -> User | None:
+        self.이름으로_조회_calls += 1
+        return self._by_name.get(이름)
+    
+    async def 이름_존재여부(self, 이름: str) -> bool:
+        self.이름_존재여부_calls += 1
+        return 이름 in self._by_name
+    
+    async def 존재하는_이름_조회(self, 이름_목록: list[str]) -> set[str]:
+        self.존재하는_이름_조회_calls += 1
+        return {이름 for 이름 in 이름_목록 if 이름 in self._by_name}
+    
+    async def 목록_조회(
+        self,
+        페이지: int,
+        페이지_크기: int,
+        활성화_여부: bool | None = None,
+        정렬_필드: str = "생성일시",
+        정렬_방향: str = "desc",
+        커서: tuple[Any, int] | None = None
+    ) -> tuple[list[User], int]:
+        self.목록_조회_calls += 1
+        
+        users = [
+            user for user in self._store.values()
+            if 활성화_여부 is None or user.활성화 == 활성화_여부
+        ]
+        
+        def 정렬_키(user: User) -> tuple:
+            return (getattr(user, 정렬_필드), user.id)
+        
+        내림차순 = 정렬_방향 == "desc"
+        users.sort(key=정렬_키, reverse=내림차순)
+        
+        if 커서 is not None:
+            users = [
+                user for user in users
+                if (정렬_키(user) < 커서 if 내림차순 else 정렬_키(user) > 커서)
+            ]
+            page = users[:페이지_크기]
+            total = 0  # Keyset은 개수를 세지 않음
+        else:
+            offset = (페이지 - 1) * 페이지_크기
+            page = users[offset:offset + 페이지_크기]
+            total = len(users)
+        
+        return page, total
+    
+    async def 수정(self, user: User) -> User:
+        self.수정_calls += 1
+        return self._저장(user)
+    
+    async def 삭제(self, user_id: int) -> bool:
+        self.삭제_calls += 1
+        user = self._store.pop(user_id, None)
+        
+        if user is None:
+            return False
+        
+        del self._by_name[user.이름]
+        return True
+    
+    async def 일괄_생성(self, users: list[User]) -> list[User]:
+        self.일괄_생성_calls += 1
+        
+        # UserRepository와 같이 새 객체를 저장/반환하고 생성 값은 인자에도 반영
+        created = []
+        for user in users:
+            저장된 = self._저장(
+                User(이름=user.이름, 이메일=user.이메일, 활성화=user.활성화)
+            )
+            user.id = 저장된.id
+            user.활성화 = 저장된.활성화
+            user.생성일시 = 저장된.생성일시
+            created.append(저장된)
+        return created
@@ -4,13 +4,15 @@
 AAA 패턴(Arrange-Act-Assert)을 사용하여 테스트를 작성합니다.
 """
 import pytest
-from unittest.mock import AsyncMock, Mock
+from datetime import datetime
 
 from src.service.user_service import UserService
 from src.domain.user import User
 from src.dto.request.user import UserCreateDTO, UserUpdateDTO
 from src.dto.response.user import PaginatedResponse
 
+from tests.fakes import InMemoryUserRepository
+
 
 class Test사용자서비스:
     """UserService 테스트 클래스
@@ -21,20 +23,21 @@ class Test사용자서비스:
     # Fixtures
     
     @pytest.fixture
-    def mock_repository(self):
-        """Mock Repository 픽스처
+    def fake_repository(self):
+        """Fake Repository 픽스처
         
-        AsyncMock을 사용하여 비동기 메서드를 모킹합니다.
+        AsyncMock 대신 dict 기반 In-memory Repository를 사용합니다.
+        호출 여부는 `<메서드명>_calls` 카운터로, 결과는 저장소 상태로 검증합니다.
         """
-        return AsyncMock()
+        return InMemoryUserRepository()
     
     @pytest.fixture
-    def user_service(self, mock_repository):
+    def user_service(self, fake_repository):
         """UserService 픽스처
         
-        의존성 주입을 통해 Mock Repository를 주입합니다.
+        의존성 주입을 통해 Fake Repository를 주입합니다.
         """
-        return UserService(mock_repository)
+        return UserService(fake_repository)
     
     @pytest.fixture
     def 샘플_사용자_DTO(self):
@@ -60,9 +63,8 @@ class Test사용자서비스:
     async def test_사용자_생성_성공(
         self,
         user_service,
-        mock_repository,
-        샘플_사용자_DTO,
-        샘플_사용자
+        fake_repository,
+        샘플_사용자_DTO
     ):
         """사용자 생성이 정상적으로 동작하는 경우
         
@@ -71,9 +73,7 @@ class Test사용자서비스:
         - Act: 테스트 대상 실행
         - Assert: 결과 검증
         """
-        # Arrange (준비)
-        mock_repository.이름으로_조회.return_value = None  # 중복 없음
-        mock_repository.생성.return_value = 샘플_사용자
+        # Arrange (준비) - 빈 저장소 (중복 없음)
         
         # Act (실행)
         result = await user_service.사용자_생성(샘플_사용자_DTO)
@@ -82,35 +82,54 @@ class Test사용자서비스:
         assert result.이름 == "홍길동"
         assert result.이메일 == "hong@test.com"
         assert result.활성화 is True
+        assert fake_repository._store[result.id] is result
         
-        # Mock 호출 검증
-        mock_repository.이름으로_조회.assert_called_once_with("홍길동")
-        mock_repository.생성.assert_called_once()
+        # Repository 호출 검증
+        assert fake_repository.이름_존재여부_calls == 1
+        assert fake_repository.생성_calls == 1
     
     @pytest.mark.asyncio
     async def test_중복_이름으로_사용자_생성시_ValueError_발생(
         self,
         user_service,
-        mock_repository,
+        fake_repository,
         샘플_사용자_DTO,
         샘플_사용자
     ):
         """중복된 이름으로 사용자 생성 시 ValueError 발생"""
         # Arrange
-        mock_repository.이름으로_조회.return_value = 샘플_사용자  # 중복 있음
+        fake_repository.추가(샘플_사용자)  # 중복 있음
         
         # Act & Assert
         with pytest.raises(ValueError, match="이미 존재하는 이름"):
             await user_service.사용자_생성(샘플_사용자_DTO)
         
         # 생성 메서드는 호출되지 않아야 함
-        mock_repository.생성.assert_not_called()
+        assert fake_repository.생성_calls == 0
+    
+    @pytest.mark.asyncio
+    async def test_공백_포함_중복_이름으로_사용자_생성시_ValueError_발생(
+        self,
+        user_service,
+        fake_repository,
+        샘플_사용자
+    ):
+        """앞뒤 공백을 제거한 이름으로 중복을 검증"""
+        # Arrange
+        fake_repository.추가(샘플_사용자)
+        공백_포함_DTO = UserCreateDTO(이름=" 홍길동 ", 이메일="hong2@test.com")
+        
+        # Act & Assert
+        with pytest.raises(ValueError, match="이미 존재하는 이름"):
+            await user_service.사용자_생성(공백_포함_DTO)
+        
+        assert fake_repository.생성_calls == 0
     
     @pytest.mark.asyncio
     async def test_짧은_이름으로_사용자_생성시_ValueError_발생(
         self,
         user_service,
-        mock_repository
+        fake_repository
     ):
         """3자 미만의 이름으로 사용자 생성 시 ValueError 발생"""
         # Arrange
@@ -124,14 +143,14 @@ class Test사용자서비스:
             await user_service.사용자_생성(짧은_이름_DTO)
         
         # Repository 호출 없음
-        mock_repository.이름으로_조회.assert_not_called()
-        mock_repository.생성.assert_not_called()
+        assert fake_repository.이름_존재여부_calls == 0
+        assert fake_repository.생성_calls == 0
     
     @pytest.mark.asyncio
     async def test_긴_이름으로_사용자_생성시_ValueError_발생(
         self,
         user_service,
-        mock_repository
+        fake_repository
     ):
         """50자 초과 이름으로 사용자 생성 시 ValueError 발생"""
         # Arrange
@@ -148,7 +167,7 @@ class Test사용자서비스:
     async def test_잘못된_이메일_형식으로_사용자_생성시_ValueError_발생(
         self,
         user_service,
-        mock_repository
+        fake_repository
     ):
         """잘못된 이메일 형식으로 사용자 생성 시 ValueError 발생"""
         # Arrange
@@ -165,8 +184,7 @@ class Test사용자서비스:
     async def test_이름과_이메일이_정규화되어_저장됨(
         self,
         user_service,
-        mock_repository,
-        샘플_사용자
+        fake_repository
     ):
         """이름은 trim, 이메일은 소문자로 정규화되어 저장"""
         # Arrange
@@ -174,16 +192,84 @@ class Test사용자서비스:
             이름="  홍길동  ",  # 앞뒤 공백
             이메일="HONG@TEST.COM"  # 대문자
         )
-        mock_repository.이름으로_조회.return_value = None
-        mock_repository.생성.return_value = 샘플_사용자
         
         # Act
-        await user_service.사용자_생성(공백_포함_DTO)
+        result = await user_service.사용자_생성(공백_포함_DTO)
+        
+        # Assert - 저장된 엔티티 확인
+        저장된_사용자 = fake_repository._store[result.id]
+        assert 저장된_사용자.이름 == "홍길동"  # 공백 제거
+        assert 저장된_사용자.이메일 == "hong@test.com"  # 소문자 변환
+        assert "홍길동" in fake_repository._by_name
+    
+    # 사용자 일괄 생성 테스트
+    
+    @pytest.mark.asyncio
+    async def test_사용자_일괄_생성_성공(
+        self,
+        user_service,
+        fake_repository
+    ):
+        """이름 중복은 한 번의 조회로 검증하고 일괄 저장"""
+        # Arrange
+        dtos = [
+            UserCreateDTO(이름="홍길동", 이메일="HONG@test.com"),
+            UserCreateDTO(이름="김철수", 이메일="kim@test.com"),
+        ]
+        
+        # Act
+        result = await user_service.사용자_일괄_생성(dtos)
+        
+        # Assert
+        assert [user.이름 for user in result] == ["홍길동", "김철수"]
+        assert result[0].이메일 == "hong@test.com"
+        assert len(fake_repository._store) == 2
+        assert fake_repository.존재하는_이름_조회_calls == 1
+        assert fake_repository.이름_존재여부_calls == 0
+        assert fake_repository.일괄_생성_calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_기존_이름_포함시_일괄_생성_ValueError_발생(
+        self,
+        user_service,
+        fake_repository
+    ):
+        """이미 존재하는 이름이 있으면 전체 목록을 담아 ValueError 발생"""
+        # Arrange
+        fake_repository.추가(
+            User(id=1, 이름="홍길동", 이메일="hong@test.com"),
+            User(id=2, 이름="김철수", 이메일="kim@test.com"),
+        )
+        dtos = [
+            UserCreateDTO(이름="홍길동", 이메일="hong@test.com"),
+            UserCreateDTO(이름="김철수", 이메일="kim@test.com"),
+            UserCreateDTO(이름="이영희", 이메일="lee@test.com"),
+        ]
+        
+        # Act & Assert
+        with pytest.raises(ValueError, match="이미 존재하는 이름입니다: 김철수, 홍길동"):
+            await user_service.사용자_일괄_생성(dtos)
+        
+        assert fake_repository.일괄_생성_calls == 0
+    
+    @pytest.mark.asyncio
+    async def test_요청_내_이름_중복시_일괄_생성_ValueError_발생(
+        self,
+        user_service,
+        fake_repository
+    ):
+        """같은 요청 안에 중복된 이름이 있으면 DB 조회 없이 ValueError 발생"""
+        # Arrange
+        dtos = [
+            UserCreateDTO(이름="홍길동", 이메일="hong@test.com"),
+            UserCreateDTO(이름=" 홍길동 ", 이메일="hong2@test.com"),
+        ]
+        
+        # Act & Assert
+        with pytest.raises(ValueError, match="요청에 중복된 이름"):
+            await user_service.사용자_일괄_생성(dtos)
         
-        # Assert - 생성 메서드에 전달된 인자 확인
-        call_args = mock_repository.생성.call_args[0][0]
-        assert call_args.이름 == "홍길동"  # 공백 제거
-        assert call_args.이메일 == "hong@test.com"  # 소문자 변환
+        assert fake_repository.존재하는_이름_조회_calls == 0
     
     # 사용자 조회 테스트
     
@@ -191,12 +277,12 @@ class Test사용자서비스:
     async def test_사용자_조회_성공(
         self,
         user_service,
-        mock_repository,
+        fake_repository,
         샘플_사용자
     ):
         """사용자 조회가 정상적으로 동작하는 경우"""
         # Arrange
-        mock_repository.조회.return_value = 샘플_사용자
+        fake_repository.추가(샘플_사용자)
         
         # Act
         result = await user_service.사용자_조회(1)
@@ -204,17 +290,16 @@ class Test사용자서비스:
         # Assert
         assert result.id == 1
         assert result.이름 == "홍길동"
-        mock_repository.조회.assert_called_once_with(1)
+        assert fake_repository.조회_calls == 1
     
     @pytest.mark.asyncio
     async def test_존재하지_않는_사용자_조회시_ValueError_발생(
         self,
         user_service,
-        mock_repository
+        fake_repository
     ):
         """존재하지 않는 사용자 조회 시 ValueError 발생"""
-        # Arrange
-        mock_repository.조회.return_value = None
+        # Arrange - 빈 저장소
         
         # Act & Assert
         with pytest.raises(ValueError, match="사용자를 찾을 수 없습니다"):
@@ -226,15 +311,14 @@ class Test사용자서비스:
     async def test_사용자_목록_조회_성공(
         self,
         user_service,
-        mock_repository
+        fake_repository
     ):
         """사용자 목록 조회가 정상적으로 동작하는 경우"""
         # Arrange
-        users = [
+        fake_repository.추가(
             User(id=1, 이름="홍길동", 이메일="hong@test.com"),
             User(id=2, 이름="김철수", 이메일="kim@test.com"),
-        ]
-        mock_repository.목록_조회.return_value = (users, 2)
+        )
         
         # Act
         result = await user_service.사용자_목록_조회(페이지=1, 페이지_크기=20)
@@ -245,25 +329,26 @@ class Test사용자서비스:
         assert result.total == 2
         assert result.page == 1
         assert result.pages == 1
+        assert fake_repository.목록_조회_calls == 1
     
     @pytest.mark.asyncio
     async def test_페이지_번호_0_이하로_조회시_ValueError_발생(
         self,
         user_service,
-        mock_repository
+        fake_repository
     ):
         """페이지 번호가 0 이하인 경우 ValueError 발생"""
         # Act & Assert
         with pytest.raises(ValueError, match="페이지 번호는 1 이상"):
             await user_service.사용자_목록_조회(페이지=0)
         
-        mock_repository.목록_조회.assert_not_called()
+        assert fake_repository.목록_조회_calls == 0
     
     @pytest.mark.asyncio
     async def test_페이지_크기_범위_벗어나면_ValueError_발생(
         self,
         user_service,
-        mock_repository
+        fake_repository
     ):
         """페이지 크기가 1-100 범위를 벗어나면 ValueError 발생"""
         # Act & Assert
@@ -273,58 +358,110 @@ class Test사용자서비스:
         with pytest.raises(ValueError, match="페이지 크기는 1-100 사이"):
             await user_service.사용자_목록_조회(페이지=1, 페이지_크기=101)
     
+    @pytest.mark.asyncio
+    async def test_커서_목록_조회시_다음_커서로_이어서_조회(
+        self,
+        user_service,
+        fake_repository
+    ):
+        """가득 찬 페이지는 다음 커서를 반환하고, 다음 페이지는 커서 이후부터 조회"""
+        # Arrange - 생성일시가 같으면 id 역순
+        생성일시 = datetime(2024, 1, 1, 12, 0, 0)
+        fake_repository.추가(
+            User(id=1, 이름="홍길동", 이메일="hong@test.com", 생성일시=생성일시),
+            User(id=2, 이름="김철수", 이메일="kim@test.com", 생성일시=생성일시),
+            User(id=3, 이름="이영희", 이메일="lee@test.com", 생성일시=생성일시),
+        )
+        
+        # Act
+        첫_페이지, 다음_커서 = await user_service.사용자_커서_목록_조회(페이지_크기=2)
+        둘째_페이지, 마지막_커서 = await user_service.사용자_커서_목록_조회(
+            다음_커서,
+            페이지_크기=2
+        )
+        
+        # Assert
+        assert [item.id for item in 첫_페이지] == [3, 2]
+        assert 다음_커서 is not None
+        assert [item.id for item in 둘째_페이지] == [1]
+        assert 마지막_커서 is None
+    
+    @pytest.mark.asyncio
+    async def test_마지막_페이지면_다음_커서_None(
+        self,
+        user_service,
+        fake_repository,
+        샘플_사용자
+    ):
+        """페이지 크기보다 적게 조회되면 다음 커서가 없음"""
+        # Arrange
+        fake_repository.추가(샘플_사용자)
+        
+        # Act
+        items, 다음_커서 = await user_service.사용자_커서_목록_조회(페이지_크기=20)
+        
+        # Assert
+        assert len(items) == 1
+        assert 다음_커서 is None
+    
+    @pytest.mark.asyncio
+    async def test_잘못된_커서로_조회시_ValueError_발생(
+        self,
+        user_service,
+        fake_repository
+    ):
+        """디코딩할 수 없는 커서는 ValueError 발생"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="올바른 커서 형식"):
+            await user_service.사용자_커서_목록_조회("not-a-cursor")
+        
+        assert fake_repository.목록_조회_calls == 0
+    
     # 사용자 수정 테스트
     
     @pytest.mark.asyncio
     async def test_사용자_수정_성공(
         self,
         user_service,
-        mock_repository,
+        fake_repository,
         샘플_사용자
     ):
         """사용자 수정이 정상적으로 동작하는 경우"""
         # Arrange
+        fake_repository.추가(샘플_사용자)
         수정_DTO = UserUpdateDTO(
             이름="홍길순",
             이메일="hongsoon@test.com"
         )
-        수정된_사용자 = User(
-            id=1,
-            이름="홍길순",
-            이메일="hongsoon@test.com"
-        )
-        
-        mock_repository.조회.return_value = 샘플_사용자
-        mock_repository.이름으로_조회.return_value = None
-        mock_repository.수정.return_value = 수정된_사용자
         
         # Act
         result = await user_service.사용자_수정(1, 수정_DTO)
         
         # Assert
         assert result.이름 == "홍길순"
-        mock_repository.수정.assert_called_once()
+        assert result.이메일 == "hongsoon@test.com"
+        assert fake_repository.수정_calls == 1
+        assert "홍길순" in fake_repository._by_name
+        assert "홍길동" not in fake_repository._by_name
     
     @pytest.mark.asyncio
     async def test_다른_사용자가_사용중인_이름으로_수정시_ValueError_발생(
         self,
         user_service,
-        mock_repository,
+        fake_repository,
         샘플_사용자
     ):
         """다른 사용자가 이미 사용 중인 이름으로 수정 시 ValueError 발생"""
         # Arrange
-        수정_DTO = UserUpdateDTO(이름="김철수")
         다른_사용자 = User(id=2, 이름="김철수", 이메일="kim@test.com")
-        
-        mock_repository.조회.return_value = 샘플_사용자
-        mock_repository.이름으로_조회.return_value = 다른_사용자
+        fake_repository.추가(샘플_사용자, 다른_사용자)
+        수정_DTO = UserUpdateDTO(이름="김철수")
         
         # Act & Assert
         with pytest.raises(ValueError, match="이미 존재하는 이름"):
             await user_service.사용자_수정(1, 수정_DTO)
         
-        mock_repository.수정.assert_not_called()
+        assert fake_repository.수정_calls == 0
     
     # 사용자 삭제 테스트
     
@@ -332,36 +469,36 @@ class Test사용자서비스:
     async def test_사용자_삭제_성공(
         self,
         user_service,
-        mock_repository,
+        fake_repository,
         샘플_사용자
     ):
         """사용자 삭제가 정상적으로 동작하는 경우"""
         # Arrange
-        mock_repository.조회.return_value = 샘플_사용자
-        mock_repository.삭제.return_value = True
+        fake_repository.추가(샘플_사용자)
         
         # Act
         result = await user_service.사용자_삭제(1)
         
         # Assert
         assert result is True
-        mock_repository.삭제.assert_called_once_with(1)
+        assert 1 not in fake_repository._store
+        assert fake_repository.삭제_calls == 1
+        assert fake_repository.조회_calls == 0  # 사전 조회 없음
     
     @pytest.mark.asyncio
     async def test_존재하지_않는_사용자_삭제시_ValueError_발생(
         self,
         user_service,
-        mock_repository
+        fake_repository
     ):
         """존재하지 않는 사용자 삭제 시 ValueError 발생"""
-        # Arrange
-        mock_repository.조회.return_value = None
+        # Arrange - 빈 저장소
         
         # Act & Assert
         with pytest.raises(ValueError, match="사용자를 찾을 수 없습니다"):
             await user_service.사용자_삭제(999)
         
-        mock_repository.삭제.assert_not_called()
+        assert fake_repository.삭제_calls == 1
 
 
 # 통합 테스트 예시 (선택적)
@@ -430,15 +567,12 @@ class Test이름_검증:
     async def test_이름_길이_검증(
         self,
         이름,
-        예상_결과,
-        user_service,
-        mock_repository
+        예상_결과
     ):
         """다양한 이름 길이에 대한 검증 테스트"""
         # Arrange
+        user_service = UserService(InMemoryUserRepository())
         dto = UserCreateDTO(이름=이름, 이메일="test@test.com")
-        mock_repository.이름으로_조회.return_value = None
-        mock_repository.생성.return_value = User(id=1, 이름=이름, 이메일="test@test.com")
         
         # Act & Assert
         if 예상_결과:
@@ -447,3 +581,28 @@ class Test이름_검증:
         else:
             with pytest.raises(ValueError):
                 await user_service.사용자_생성(dto)
+
+
+class Test이메일_검증:
+    """Parametrize를 사용한 이메일 형식 테스트"""
+    
+    @pytest.mark.parametrize("이메일,예상_결과", [
+        ("hong@test.com", True),          # 기본 형식
+        ("hong.gd+tag@mail.test.co", True),  # 특수문자, 다단계 도메인
+        ("invalid-email", False),         # @ 없음
+        ("hong@test", False),             # TLD 없음
+        ("hong@test.c", False),           # TLD 1자
+        ("hong@test.com\n", False),       # 끝 개행
+        ("홍길동@test.com", False),        # 비 ASCII
+    ])
+    def test_이메일_형식_검증(self, 이메일, 예상_결과):
+        """다양한 이메일 형식에 대한 검증 테스트"""
+        # Arrange
+        user_service = UserService(InMemoryUserRepository())
+        
+        # Act & Assert
+        if 예상_결과:
+            user_service._이메일_형식_검증(이메일)
+        else:
+            with pytest.raises(ValueError, match="올바른 이메일 형식"):
+                user_service._이메일_형식_검증(이메일)